@@ -1,12 +1,12 @@
-import json
 import logging
+import sys
 import time
 
-
-from typing import Dict, Any, Optional, List, cast, Tuple, Callable
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Mapping, Any, Optional, List, cast, Tuple, Callable
 
 from dasbus.error import DBusError
-from dasbus.typing import get_native
 from dasbus.loop import EventLoop
 from dasbus.connection import SessionMessageBus
 from dasbus.client.proxy import (
@@ -15,13 +15,17 @@ from dasbus.client.proxy import (
     get_object_handler as goh,
 )
 import threading
+import weakref
+from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
 from hassmpris_agent.mpris.dbus.chromium import ChromiumObjectHandler
 from hassmpris_agent.mpris.dbus.vlc import VLCObjectHandler
 
 import gi
 
 gi.require_version("GLib", "2.0")
-from gi.repository import GLib, GObject  # noqa
+gi.require_version("Gio", "2.0")
+from gi.repository import GLib, GObject, Gio  # noqa
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,20 +34,25 @@ STATUS_PLAYING = "Playing"
 STATUS_PAUSED = "Paused"
 STATUS_STOPPED = "Stopped"
 
-PROP_PLAYBACKSTATUS = "PlaybackStatus"
-PROP_MINIMUM_RATE = "MinimumRate"
-PROP_MAXIMUM_RATE = "MaximumRate"
-PROP_RATE = "Rate"
-PROP_POSITION = "Position"
-PROP_METADATA = "Metadata"
+# Property names are used as dictionary keys on every PropertiesChanged
+# signal, so they are explicitly interned.
+PROP_PLAYBACKSTATUS = sys.intern("PlaybackStatus")
+PROP_MINIMUM_RATE = sys.intern("MinimumRate")
+PROP_MAXIMUM_RATE = sys.intern("MaximumRate")
+PROP_RATE = sys.intern("Rate")
+PROP_POSITION = sys.intern("Position")
+PROP_METADATA = sys.intern("Metadata")
 
 ALL_CAN_PROPS = {
-    "CanControl": False,
-    "CanPause": False,
-    "CanPlay": False,
-    "CanSeek": False,
-    "CanGoNext": False,
-    "CanGoPrevious": False,
+    sys.intern(p): False
+    for p in (
+        "CanControl",
+        "CanPause",
+        "CanPlay",
+        "CanSeek",
+        "CanGoNext",
+        "CanGoPrevious",
+    )
 }
 ALL_NUMERIC_PROPS = {
     PROP_MINIMUM_RATE: 1.0,
@@ -55,30 +64,133 @@ ALL_OTHER_PROPS = {
     PROP_METADATA: lambda: dict(),
 }
 ALL_PROPS = ALL_OTHER_PROPS | ALL_CAN_PROPS | ALL_NUMERIC_PROPS
+_ALL_PROPS_SET = frozenset(ALL_PROPS)
+_ALL_PROPS_DEFAULTS_STATIC: Tuple[Tuple[str, Any], ...] = tuple(
+    (k, v) for k, v in ALL_PROPS.items() if not callable(v)
+)
+_ALL_PROPS_DEFAULTS_FACTORY: Tuple[Tuple[str, Callable[[], Any]], ...] = tuple(
+    (k, v) for k, v in ALL_PROPS.items() if callable(v)
+)
+
+_MPRIS_PREFIX = "org.mpris.MediaPlayer2"
+
+# Playback statuses as tracked by PollSeekController, usable as indexes.
+_S_STOPPED, _S_PAUSED, _S_PLAYING = 0, 1, 2
+_INT_TO_STATUS = (STATUS_STOPPED, STATUS_PAUSED, STATUS_PLAYING)
+_STATUS_TO_INT = {s: i for i, s in enumerate(_INT_TO_STATUS)}
+
+_Predictor = Callable[
+    [float, float, float, float, float, float],
+    Tuple[float, float],
+]
+
+# Range of positions (in seconds) a player may be at if it has not been
+# seeked, indexed by [from_status][to_status].  Arguments are the position
+# at the last change, the time elapsed since then, minimum rate, maximum
+# rate, the gap since the previous check (which spans several ticks when
+# polling backs off) and slack.
+_PREDICTORS: Tuple[Tuple[_Predictor, ...], ...] = (
+    # From stopped.
+    (
+        lambda lp, te, mn, mx, gp, sl: (0.0, 0.0),
+        lambda lp, te, mn, mx, gp, sl: (0.0, 0.0),
+        lambda lp, te, mn, mx, gp, sl: (0.0, gp * mx + sl),
+    ),
+    # From paused.
+    (
+        lambda lp, te, mn, mx, gp, sl: (0.0, lp + te * mx + sl),
+        lambda lp, te, mn, mx, gp, sl: (lp, lp),
+        lambda lp, te, mn, mx, gp, sl: (lp, lp + gp * mx + sl),
+    ),
+    # From playing.
+    (
+        lambda lp, te, mn, mx, gp, sl: (0.0, gp * mx + sl),
+        lambda lp, te, mn, mx, gp, sl: (lp, lp + te * mx + sl),
+        lambda lp, te, mn, mx, gp, sl: (lp + te * mn - sl, lp + te * mx + sl),
+    ),
+)
+
+# How long (in seconds) a position retrieved from a player is reused by
+# Player.get_position, depending on whether the player is playing (in
+# which case the position is extrapolated) or not.
+POSITION_CACHE_PLAYING_TTL = 0.1
+POSITION_CACHE_TTL = 0.5
+
+# A requested position closer than this (in seconds) to the player's
+# cached position on the same track is not sent to the player at all.
+SET_POSITION_TOLERANCE = 0.05
+
+# Window (in milliseconds) during which successive seeks or position
+# changes requested for the same player are coalesced into one.
+SEEK_COALESCE_MS = 30
+
+# Microseconds per second, the unit MPRIS uses for positions and offsets.
+_USEC = 1_000_000
+_USEC_TO_S = 1.0 / _USEC
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _to_usec(seconds: float) -> int:
+    """
+    Converts seconds to the (64 bit) microseconds MPRIS uses.  Raises
+    OverflowError or ValueError if that is not possible.
+    """
+    usec = int(seconds * _USEC)
+    if not _INT64_MIN <= usec <= _INT64_MAX:
+        raise OverflowError("%s seconds is out of range" % seconds)
+    return usec
 
 
 def deepequals(one: Any, two: Any) -> bool:
-    one_j = json.dumps(one, sort_keys=True)
-    two_j = json.dumps(two, sort_keys=True)
-    return one_j == two_j
+    # Values are already unpacked into plain dicts, lists and scalars, whose
+    # equality is structural and independent of dictionary key order.  The
+    # identity check spares walking a value compared against itself.
+    return one is two or bool(one == two)
+
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
 
 
 def unpack(obj: Any) -> Any:
+    if type(obj) in _SCALAR_TYPES:
+        return obj
     if isinstance(obj, GLib.Variant):
-        obj = get_native(obj)
+        # Variant.unpack() already converts the whole tree to native
+        # values, so there is nothing left to walk afterwards.
+        return obj.unpack()
+    # Containers are only rebuilt when some member actually needs unpacking.
     if isinstance(obj, dict):
-        obj = dict((unpack(k), unpack(v)) for k, v in obj.items())
+        if any(
+            type(k) not in _SCALAR_TYPES or type(v) not in _SCALAR_TYPES
+            for k, v in obj.items()
+        ):
+            obj = {unpack(k): unpack(v) for k, v in obj.items()}
     elif isinstance(obj, list):
-        obj = [unpack(k) for k in obj]
+        if any(type(v) not in _SCALAR_TYPES for v in obj):
+            obj = [unpack(v) for v in obj]
     return obj
 
 
+def _unpack_str(v: Any) -> Any:
+    # Fast path for string properties such as PlaybackStatus.  Players that
+    # send some other type go through the generic unpack() instead.
+    if isinstance(v, GLib.Variant) and v.get_type_string() in ("s", "o"):
+        return v.get_string()
+    return unpack(v)
+
+
+def _unpack_bool(v: Any) -> Any:
+    # Fast path for the boolean Can* properties; same caveat as above.
+    if isinstance(v, GLib.Variant) and v.get_type_string() == "b":
+        return v.get_boolean()
+    return unpack(v)
+
+
 def test_properties_proxy_for_timeout(proxy: InterfaceProxy) -> None:
     """Check for timeouts."""
     handler = goh(proxy)
     try:
         _LOGGER.debug("Entering potential hang as properties are retrieved")
-        time.sleep(0.05)
         handler._call_method(
             "org.freedesktop.DBus.Properties",
             "Get",
@@ -98,6 +210,10 @@ class BadPlayer(DBusError):
     pass
 
 
+class NoPosition(ValueError):
+    """The player does not report a current position."""
+
+
 class BaseSeekController(GObject.GObject):
     __gsignals__ = {
         # Emitted when the player being monitored has seeked in a way that is
@@ -152,7 +268,7 @@ class SignalSeekController(BaseSeekController):
         self,
         pos_usec: int,
     ) -> None:
-        pos = float(pos_usec) / 1000 / 1000
+        pos = pos_usec * _USEC_TO_S
         self.emit("seeked", pos)
 
     def __del__(self) -> None:
@@ -162,30 +278,50 @@ class SignalSeekController(BaseSeekController):
 
 class PollSeekController(BaseSeekController):
     TICK = 1
+    # While stopped, the position cannot change; the player is only polled
+    # every this many ticks, unless it signals a playback status change.
+    STOPPED_TICKS = 5
+    # While paused, the position only changes if the user seeks, so the
+    # player is polled less often as well.
+    PAUSED_TICKS = 3
     _prop_proxy_connected = False
 
+    # All started controllers are checked from a single shared timeout.
+    _instances: "weakref.WeakSet[PollSeekController]" = weakref.WeakSet()
+    _shared_source: Optional[int] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self, control_proxy, properties_proxy):
         # type: (InterfaceProxy, InterfaceProxy) -> None
         super().__init__(control_proxy, properties_proxy)
+        self.started = False
+        self._idle_ticks = 0
         (
             self._last_checked,
             self._status,
             self._position,
             self._rate,
         ) = self._get_pbstatus_pos_rate()
+        self._last_sampled = self._last_checked
         _LOGGER.debug("Poll seek controller chosen")
-        self._source: Any = None
 
     def start(self) -> None:
-        if self._source is None:
-            time.sleep(0.05)
+        if not self.started:
             self.properties_proxy.PropertiesChanged.connect(
                 self._check_playback_change,
             )
-            self._source = GLib.timeout_add(self.TICK * 1000, self._check_seeked)
+            self.started = True
+            cls = PollSeekController
+            with cls._shared_lock:
+                cls._instances.add(self)
+                if cls._shared_source is None:
+                    cls._shared_source = GLib.timeout_add(
+                        self.TICK * 1000,
+                        cls._tick_all,
+                    )
 
     def stop(self) -> None:
-        if self._source is not None:
+        if self.started:
             try:
                 self.properties_proxy.PropertiesChanged.disconnect(
                     self._check_playback_change,
@@ -193,8 +329,37 @@ class PollSeekController(BaseSeekController):
             except (ImportError, DBusError):
                 # Python or the MPRIS bus owner is shutting down.
                 pass
-            GLib.source_remove(self._source)
-            self._source = None
+            self.started = False
+            cls = PollSeekController
+            with cls._shared_lock:
+                cls._instances.discard(self)
+                if not cls._instances and cls._shared_source is not None:
+                    GLib.source_remove(cls._shared_source)
+                    cls._shared_source = None
+
+    @classmethod
+    def _tick_all(cls) -> bool:
+        with cls._shared_lock:
+            instances = list(cls._instances)
+        for instance in instances:
+            instance._tick()
+        with cls._shared_lock:
+            if cls._instances:
+                return True
+            cls._shared_source = None
+            return False
+
+    def _tick(self) -> None:
+        if self._status != _S_PLAYING:
+            self._idle_ticks += 1
+            if self._status == _S_STOPPED:
+                every = self.STOPPED_TICKS
+            else:
+                every = self.PAUSED_TICKS
+            if self._idle_ticks < every:
+                return
+        self._idle_ticks = 0
+        self._check_seeked()
 
     def _check_playback_change(
         self,
@@ -205,32 +370,30 @@ class PollSeekController(BaseSeekController):
         if PROP_PLAYBACKSTATUS in propdict:
             self._check_seeked()
 
-    def _get_pbstatus_pos_rate(self) -> Tuple[float, str, int, float]:
+    def _get_pbstatus_pos_rate(self) -> Tuple[float, int, int, float]:
         try:
-            props = unpack(
-                self.properties_proxy.GetAll(
-                    "org.mpris.MediaPlayer2.Player",
-                )
+            props = self.properties_proxy.GetAll(
+                "org.mpris.MediaPlayer2.Player",
             )
-
         except DBusError as e:
             raise BadPlayer("Cannot get all properties for PSK") from e
 
         if PROP_PLAYBACKSTATUS not in props:
             raise BadPlayer("Player properties do not contain PlaybackStatus")
-        if PROP_RATE not in props:
-            props[PROP_RATE] = 1.0
-        if PROP_POSITION not in props:
-            props[PROP_POSITION] = 0
+        # Only the three properties needed are unpacked; the rest (notably
+        # Metadata) are left alone.
         return (
-            time.time(),
-            props[PROP_PLAYBACKSTATUS],
-            props[PROP_POSITION],
-            props[PROP_RATE],
+            time.monotonic(),
+            _STATUS_TO_INT.get(
+                _unpack_str(props[PROP_PLAYBACKSTATUS]),
+                _S_STOPPED,
+            ),
+            unpack(props.get(PROP_POSITION, 0)),
+            unpack(props.get(PROP_RATE, 1.0)),
         )
 
     def _check_seeked(self) -> bool:
-        if self._source is None:
+        if not self.started:
             return False
 
         try:
@@ -240,73 +403,36 @@ class PollSeekController(BaseSeekController):
             self.stop()
             return False
 
-        tick = self.TICK
+        gap = checked - self._last_sampled
+        self._last_sampled = checked
         slack = self.TICK / 2
-        last_pos_s = self._position / 1000 / 1000
-        cur_pos_s = float(pos) / 1000 / 1000
-        min_rate = min([self._rate, rate])
-        max_rate = max([self._rate, rate])
+        last_pos_s = self._position * _USEC_TO_S
+        cur_pos_s = pos * _USEC_TO_S
+        if self._rate < rate:
+            min_rate, max_rate = self._rate, rate
+        else:
+            min_rate, max_rate = rate, self._rate
         time_elapsed = checked - self._last_checked
 
-        from_status = self._status
-        to_status = status
-        from_stopped = from_status == STATUS_STOPPED
-        from_paused = from_status == STATUS_PAUSED
-        from_playing = from_status == STATUS_PLAYING
-        to_stopped = to_status == STATUS_STOPPED
-        to_paused = to_status == STATUS_PAUSED
-        to_playing = to_status == STATUS_PLAYING
-
-        if from_stopped:
-            if to_stopped:
-                # checked
-                predicted_min = 0.0
-                predicted_max = 0.0
-            elif to_paused:
-                # checked
-                predicted_min = 0.0
-                predicted_max = 0.0
-            elif to_playing:
-                # checked
-                predicted_min = 0.0
-                predicted_max = tick * max_rate
-        elif from_paused:
-            if to_stopped:
-                # checked
-                predicted_min = 0.0
-                predicted_max = last_pos_s + (time_elapsed * max_rate) + slack
-            elif to_paused:
-                # checked
-                predicted_min = last_pos_s
-                predicted_max = last_pos_s
-            elif to_playing:
-                # checked
-                predicted_min = last_pos_s
-                predicted_max = last_pos_s + time_elapsed * max_rate + slack
-        elif from_playing:
-            if to_stopped:
-                # checked
-                predicted_min = 0.0
-                predicted_max = tick * max_rate
-            elif to_paused:
-                # checked
-                predicted_min = last_pos_s
-                predicted_max = last_pos_s + (time_elapsed * max_rate) + slack
-            elif to_playing:
-                # checked
-                predicted_min = last_pos_s + (time_elapsed * min_rate) - slack
-                predicted_max = last_pos_s + (time_elapsed * max_rate) + slack
-
-        seeked = status in [STATUS_PLAYING, STATUS_PAUSED] and not (
+        predicted_min, predicted_max = _PREDICTORS[self._status][status](
+            last_pos_s,
+            time_elapsed,
+            min_rate,
+            max_rate,
+            gap,
+            slack,
+        )
+
+        seeked = status != _S_STOPPED and not (
             cur_pos_s >= predicted_min and cur_pos_s <= predicted_max
         )
 
         if seeked:
             _LOGGER.debug(
                 "%s: %s->%s -- seeked, at %.2f, pred [%.2f, %.2f] at rate %s",
-                self.player,
-                self._status,
-                status,
+                self,
+                _INT_TO_STATUS[self._status],
+                _INT_TO_STATUS[status],
                 cur_pos_s,
                 predicted_min,
                 predicted_max,
@@ -342,6 +468,13 @@ class BasePropertiesController(GObject.GObject):
             None,
             (object,),
         ),
+        # Emitted after a full property refresh with the position it
+        # carried and the (monotonic) time the refresh was requested.
+        "position-refreshed": (
+            GObject.SignalFlags.RUN_LAST,
+            None,
+            (float, float),
+        ),
     }
 
     def __init__(self, properties_proxy: InterfaceProxy) -> None:
@@ -366,16 +499,48 @@ class BasePropertiesController(GObject.GObject):
                 "Cannot get MediaPlayer2.Player properties",
             ) from e
 
+    def get_properties_async(
+        self,
+        on_done: Callable[[Optional[Dict[str, Any]], float], None],
+    ) -> None:
+        """
+        Like get_properties, but does not wait for the player to reply.
+        on_done is called from the main loop with the properties (or None
+        if the player could not be queried) and the monotonic time the
+        query was sent, so that a slow player does not hold up the main loop.
+        """
+        if not hasattr(self, "properties_proxy"):
+            return
+        sent = time.monotonic()
+
+        def finish(call: Callable[[], Dict[str, Any]]) -> None:
+            try:
+                props: Optional[Dict[str, Any]] = call()
+            except (ImportError, DBusError, TimeoutError):
+                props = None
+            on_done(props, sent)
+
+        self.properties_proxy.GetAll(
+            "org.mpris.MediaPlayer2.Player",
+            callback=finish,
+        )
+
     def get_position(self) -> float | None:
         try:
             prop = self.properties_proxy.Get(
                 "org.mpris.MediaPlayer2.Player",
                 PROP_POSITION,
             )
-            return float(unpack(prop)) / 1000 / 1000
+            return float(unpack(prop) * _USEC_TO_S)
         except DBusError:
             return None
 
+    def _emit_refreshed(self, props: Dict[str, Any], sent: float) -> None:
+        self.emit("properties-changed", props)
+        if PROP_POSITION in props:
+            position = float(unpack(props[PROP_POSITION]) * _USEC_TO_S)
+            self.emit("position-refreshed", position, sent)
+
     def get_entity_properties(self) -> GLib.Variant:
         if not hasattr(self, "properties_proxy"):
             return
@@ -389,15 +554,59 @@ class BasePropertiesController(GObject.GObject):
             ) from e
 
 
+class PropertiesRefresher(object):
+    """
+    Coalesces the delayed property refreshes requested by all players
+    into a single GLib timeout.  Refreshes are scheduled and run on the
+    main loop, but may be cancelled from any thread (players are cleaned
+    up by stop_() and by failed discoveries).
+    """
+
+    DELAY_MS = 150
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: set[SignalPropertiesController] = set()
+        self._source: Optional[int] = None
+
+    def schedule(self, controller: "SignalPropertiesController") -> None:
+        with self._lock:
+            self._pending.add(controller)
+            if self._source is None:
+                self._source = GLib.timeout_add(self.DELAY_MS, self._flush)
+
+    def cancel(self, controller: "SignalPropertiesController") -> None:
+        with self._lock:
+            self._pending.discard(controller)
+            if not self._pending and self._source is not None:
+                GLib.source_remove(self._source)
+                self._source = None
+
+    def _flush(self) -> bool:
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._source = None
+        # Refreshes run without the lock, as they may schedule new ones.
+        for controller in pending:
+            controller.refresh()
+        return False
+
+
 class SignalPropertiesController(BasePropertiesController):
-    def __init__(self, properties_proxy: InterfaceProxy) -> None:
+    def __init__(
+        self,
+        properties_proxy: InterfaceProxy,
+        refresher: PropertiesRefresher,
+    ) -> None:
         """
         Creates a property retrieval controller, taking ownership of the
         properties proxy.
         """
-        self._sources: list[int] = []
+        self._refresher = refresher
         super().__init__(properties_proxy)
         self.started = False
+        # Whether every change must be followed by a full property query.
+        self.always_refresh = False
 
     def start(self) -> None:
         self.properties_proxy.PropertiesChanged.connect(
@@ -407,35 +616,41 @@ class SignalPropertiesController(BasePropertiesController):
 
     def _properties_changed(
         self,
-        unused_iface: Any,
-        unused_propdict: Dict[str, Any],
-        unused_invalidated_properties: Any,
+        iface: Any,
+        propdict: Dict[str, Any],
+        invalidated_properties: Any,
     ) -> None:
-        # Queue update CanPlay and other properties since some players
-        # like VLC sometimes neglect to do so.  We basically wait 50 ms
-        # and then query the properties again.
-        self._delayed_property_update()
-
-    def _delayed_property_update(self) -> None:
-        def inner() -> None:
-            try:
-                props = self.get_properties()
-                self.emit("properties-changed", props)
-            except DBusError:
-                # Player is gone:
-                pass
-            for source in self._sources:
-                GLib.source_remove(source)
-                if source in self._sources:
-                    self._sources.remove(source)
+        if iface != "org.mpris.MediaPlayer2.Player":
+            return
+        if _ALL_PROPS_SET.isdisjoint(propdict) and _ALL_PROPS_SET.isdisjoint(
+            invalidated_properties or ()
+        ):
+            # Only properties we do not track (Volume, Shuffle...) changed.
+            return
+        if propdict:
+            self.emit("properties-changed", propdict)
+        if self.always_refresh or invalidated_properties:
+            # Queue update CanPlay and other properties since some players
+            # like VLC sometimes neglect to do so, and invalidated ones
+            # must be fetched anyway.  We basically wait a bit and then
+            # query the properties again; further signals received in the
+            # meantime are folded into that same query.
+            self._refresher.schedule(self)
+
+    def refresh(self) -> None:
+        try:
+            self.get_properties_async(self._refreshed)
+        except DBusError:
+            # Player is gone:
+            pass
 
-        source = GLib.timeout_add(50, inner)
-        self._sources.append(source)
+    def _refreshed(self, props: Optional[Dict[str, Any]], sent: float) -> None:
+        # A player that is gone simply yields no properties.
+        if props is not None and self.started:
+            self._emit_refreshed(props, sent)
 
     def stop(self) -> None:
-        for source in self._sources:
-            GLib.source_remove(source)
-        self._sources = []
+        self._refresher.cancel(self)
         if self.started:
             self.properties_proxy.PropertiesChanged.disconnect(self._properties_changed)
         self.started = False
@@ -451,28 +666,49 @@ class PollPropertiesController(BasePropertiesController):
         Creates a property retrieval controller, taking ownership of the
         properties proxy.
         """
-        self._sources: list[int] = []
+        self._source: Optional[int] = None
+        self._querying = False
         super().__init__(properties_proxy)
         self.started = False
 
     def start(self) -> None:
-        self._sources.append(GLib.timeout_add(2000, self._periodic_property_update))
+        if self._source is None:
+            self._source = GLib.timeout_add(2000, self._periodic_property_update)
         self.started = True
 
     def _periodic_property_update(self) -> bool:
+        if self._querying:
+            # The player has not answered the previous query yet.
+            return True
         try:
-            props = self.get_properties()
+            self.get_properties_async(self._periodic_properties_ready)
         except (ImportError, DBusError):
+            # Python or the MPRIS bus owner is shutting down.  Returning
+            # False removes the timeout, so it must not be removed again.
+            self._source = None
             self.stop()
-            # Python or the MPRIS bus owner is shutting down.
             return False
-        self.emit("properties-changed", props)
+        self._querying = True
         return True
 
+    def _periodic_properties_ready(
+        self,
+        props: Optional[Dict[str, Any]],
+        sent: float,
+    ) -> None:
+        self._querying = False
+        if not self.started:
+            return
+        if props is None:
+            # Python or the MPRIS bus owner is shutting down.
+            self.stop()
+            return
+        self._emit_refreshed(props, sent)
+
     def stop(self) -> None:
-        for source in self._sources:
-            GLib.source_remove(source)
-        self._sources = []
+        if self._source is not None:
+            GLib.source_remove(self._source)
+            self._source = None
         self.started = False
 
     def __del__(self) -> None:
@@ -480,6 +716,23 @@ class PollPropertiesController(BasePropertiesController):
         BasePropertiesController.__del__(self)
 
 
+@dataclass(slots=True)
+class PlayerState:
+    """Last known values of the MPRIS properties tracked for a player."""
+
+    PlaybackStatus: str = STATUS_STOPPED
+    Metadata: Dict[str, Any] = field(default_factory=dict)
+    CanControl: bool = False
+    CanPause: bool = False
+    CanPlay: bool = False
+    CanSeek: bool = False
+    CanGoNext: bool = False
+    CanGoPrevious: bool = False
+    MinimumRate: float = 1.0
+    MaximumRate: float = 1.0
+    Rate: float = 1.0
+
+
 class Player(GObject.GObject):
     __gsignals__ = {
         "playback-status-changed": (
@@ -510,10 +763,22 @@ class Player(GObject.GObject):
     def __str__(self) -> str:
         return "<Player %s at %s>" % (self.identity, self.player_id)
 
-    def __init__(self, bus: SessionMessageBus, player_id: str) -> None:
+    def __init__(
+        self,
+        bus: SessionMessageBus,
+        player_id: str,
+        refresher: PropertiesRefresher,
+    ) -> None:
         _LOGGER.debug("Discovering player %s", player_id)
         super().__init__()
         self.player_id = player_id
+        self.state = PlayerState()
+        self._last_props: Optional[Dict[str, Any]] = None
+        # Both stay None until the player is fully set up, and go back to
+        # None when it is cleaned up; control calls check for that.
+        self.control_proxy: Optional[InterfaceProxy] = None
+        self.properties_proxy_controller: Optional[BasePropertiesController] = None
+        self._position_cache: Optional[Tuple[float, float]] = None
         self._cleanuppers: list[tuple[str, Callable[[], Any]]] = []
 
         def to_cleanup(name: str, func: Callable[[], Any]) -> None:
@@ -546,7 +811,10 @@ class Player(GObject.GObject):
                 )
 
             try:
-                prop_proxy_controller = SignalPropertiesController(prop_proxy)
+                prop_proxy_controller = SignalPropertiesController(
+                    prop_proxy,
+                    refresher,
+                )
             except DBusError as e:
                 raise BadPlayer("Cannot set up properties changed mechanism") from e
 
@@ -570,21 +838,32 @@ class Player(GObject.GObject):
                 player_id,
                 self.identity,
             )
+            identity_lc = self.identity.lower()
+            is_totem = entity_props.get("DesktopEntry") == "org.gnome.Totem"
 
-            if entity_props.get("DesktopEntry") == "org.gnome.Totem":
+            if is_totem:
                 # This player does not correctly emit the properties-changed
                 # signal, so we must default to using the other.
                 prop_proxy_controller = PollPropertiesController(prop_proxy)
+            elif "vlc" in identity_lc or "chrom" in identity_lc:
+                # These players leave properties out of their signals.
+                prop_proxy_controller.always_refresh = True
 
-            prop_proxy_controller.connect(
+            props_handler_id = prop_proxy_controller.connect(
                 "properties-changed",
                 self._handle_properties_changed,
             )
             to_cleanup(
                 "disconnect handle properties changed",
-                lambda: prop_proxy_controller.disconnect_by_func(
-                    self._handle_properties_changed
-                ),
+                lambda: prop_proxy_controller.disconnect(props_handler_id),
+            )
+            position_handler_id = prop_proxy_controller.connect(
+                "position-refreshed",
+                self._handle_position_refreshed,
+            )
+            to_cleanup(
+                "disconnect handle position refreshed",
+                lambda: prop_proxy_controller.disconnect(position_handler_id),
             )
 
             prop_proxy_controller.start()
@@ -594,10 +873,10 @@ class Player(GObject.GObject):
             )
 
             kw = {}
-            if self.identity.lower().startswith("chrom"):
-                kw["handler_factory"] = ChromiumObjectHandler
-            if "vlc" in self.identity.lower():
+            if "vlc" in identity_lc:
                 kw["handler_factory"] = VLCObjectHandler
+            elif identity_lc.startswith("chrom"):
+                kw["handler_factory"] = ChromiumObjectHandler
 
             control_proxy = cast(
                 InterfaceProxy,
@@ -614,15 +893,15 @@ class Player(GObject.GObject):
             )
 
             try:
-                if entity_props.get("DesktopEntry") == "org.gnome.Totem":
+                if is_totem:
                     raise Exception("Totem cannot use signal seek controller")
 
                 seek_controller = SignalSeekController(control_proxy, prop_proxy)
 
-                seek_controller.connect("seeked", self._handle_seek)
+                seek_handler_id = seek_controller.connect("seeked", self._handle_seek)
                 to_cleanup(
                     "disconnect seeked from seek controller",
-                    lambda: seek_controller.disconnect_by_func(self._handle_seek),
+                    partial(seek_controller.disconnect, seek_handler_id),
                 )
 
                 seek_controller.start()
@@ -634,10 +913,10 @@ class Player(GObject.GObject):
 
                 seek_controller = PollSeekController(control_proxy, prop_proxy)
 
-                seek_controller.connect("seeked", self._handle_seek)
+                seek_handler_id = seek_controller.connect("seeked", self._handle_seek)
                 to_cleanup(
                     "disconnect seeked from seek controller",
-                    lambda: seek_controller.disconnect_by_func(self._handle_seek),
+                    partial(seek_controller.disconnect, seek_handler_id),
                 )
 
                 seek_controller.start()
@@ -646,12 +925,15 @@ class Player(GObject.GObject):
             self._update_player_properties(player_props, init=True)
 
             self.control_proxy = control_proxy
-            to_cleanup("deref control proxy", lambda: delattr(self, "control_proxy"))
+            to_cleanup(
+                "deref control proxy",
+                lambda: setattr(self, "control_proxy", None),
+            )
 
             self.properties_proxy_controller = prop_proxy_controller
             to_cleanup(
                 "deref properties proxy controller",
-                lambda: delattr(self, "properties_proxy_controller"),
+                lambda: setattr(self, "properties_proxy_controller", None),
             )
         except Exception:
             self.cleanup()
@@ -668,10 +950,8 @@ class Player(GObject.GObject):
             except Exception:
                 _LOGGER.exception("Cleanup error running %s", name)
 
-    def __del__(self) -> None:
-        self.cleanup()
-
     def _handle_seek(self, unused_controller: Any, pos: float) -> None:
+        self._position_cache = (time.monotonic(), pos)
         self.emit("seeked", pos)
 
     def _handle_properties_changed(
@@ -681,25 +961,65 @@ class Player(GObject.GObject):
     ) -> None:
         self._update_player_properties(props)
 
+    def _handle_position_refreshed(
+        self,
+        unused_controller: Any,
+        position: float,
+        sent: float,
+    ) -> None:
+        # Full refreshes carry the position; keep it, so that a get_position
+        # right afterwards needs no D-Bus round trip.  It is timestamped
+        # with the time the refresh was requested, not when its (possibly
+        # late) reply arrived.
+        self._position_cache = (sent, position)
+
     def _update_player_properties(
         self,
         allplayerprops_variant: GLib.Variant,
         init: bool = False,
     ) -> None:
-        allplayerprops = unpack(allplayerprops_variant)
-        for prop, defval in ALL_PROPS.items():
-            if prop in allplayerprops:
+        # Players like VLC emit the same values over and over again.  If
+        # none of the properties we track changed since the last update,
+        # there is nothing to do.
+        tracked = {
+            k: allplayerprops_variant[k]
+            for k in allplayerprops_variant.keys() & _ALL_PROPS_SET
+        }
+        last = self._last_props
+        if not init and tracked == last:
+            return
+        self._last_props = tracked
+
+        for prop in ALL_PROPS:
+            if prop in tracked:
                 # We have this property.  We update the value we have locally,
                 # taking care not to emit anything during initialization.
-                self._set_property(prop, allplayerprops[prop], init)
-            elif init:
-                # We are initializing.
-                # Accordingly, since we assume we are getting all the player
-                # properties known through D-Bus, then we take the liberty
-                # of updating all even with default values.
-                if callable(defval):
-                    defval = defval()
-                self._set_property(prop, defval, init)
+                # Only the properties we track are unpacked, and the scalar
+                # ones skip the recursive unpack() entirely.
+                value = tracked[prop]
+                if not init and last is not None and last.get(prop) == value:
+                    # Same variant as last time (compared by GLib itself),
+                    # so skip unpacking it -- this matters for Metadata.
+                    continue
+                if prop == PROP_PLAYBACKSTATUS:
+                    value = _unpack_str(value)
+                elif prop in ALL_CAN_PROPS:
+                    value = _unpack_bool(value)
+                else:
+                    value = unpack(value)
+                self._set_property(prop, value, init)
+
+        if init:
+            # We are initializing.
+            # Accordingly, since we assume we are getting all the player
+            # properties known through D-Bus, then we take the liberty
+            # of updating all even with default values.
+            for prop, defval in _ALL_PROPS_DEFAULTS_STATIC:
+                if prop not in tracked:
+                    self._set_property(prop, defval, init)
+            for prop, factory in _ALL_PROPS_DEFAULTS_FACTORY:
+                if prop not in tracked:
+                    self._set_property(prop, factory(), init)
 
     def _set_property(
         self,
@@ -718,10 +1038,12 @@ class Player(GObject.GObject):
             value = 1.0
         if init:
             # We are not emitting anything during initialization.
-            setattr(self, prop, value)
+            setattr(self.state, prop, value)
             return
-        if not deepequals(value, getattr(self, prop)):
-            setattr(self, prop, value)
+        if not deepequals(value, getattr(self.state, prop)):
+            setattr(self.state, prop, value)
+            # Status, track or rate changes make the cached position useless.
+            self._position_cache = None
             if prop == PROP_PLAYBACKSTATUS:
                 self.emit("playback-status-changed", value)
             elif prop == PROP_METADATA:
@@ -729,79 +1051,152 @@ class Player(GObject.GObject):
             else:
                 self.emit("property-changed", prop, value)
 
+    def _cached_position(self) -> float | None:
+        cached = self._position_cache
+        if cached is not None:
+            ts, pos = cached
+            age = time.monotonic() - ts
+            if self.state.PlaybackStatus == STATUS_PLAYING:
+                if age < POSITION_CACHE_PLAYING_TTL:
+                    return pos + age * self.state.Rate
+            elif age < POSITION_CACHE_TTL:
+                return pos
+        return None
+
     def get_position(self) -> float | None:
-        return self.properties_proxy_controller.get_position()
+        position = self._cached_position()
+        if position is not None:
+            return position
+        controller = self.properties_proxy_controller
+        if controller is None:
+            return None
+        position = controller.get_position()
+        if position is not None:
+            self._position_cache = (time.monotonic(), position)
+        return position
 
     def play(self) -> None:
-        if hasattr(self, "control_proxy"):
-            self.control_proxy.Play()
+        proxy = self.control_proxy
+        if proxy is not None:
+            proxy.Play()
 
     def pause(self) -> None:
-        if hasattr(self, "control_proxy"):
-            self.control_proxy.Pause()
+        proxy = self.control_proxy
+        if proxy is not None:
+            proxy.Pause()
 
     def stop(self) -> None:
-        if hasattr(self, "control_proxy"):
-            self.control_proxy.Stop()
+        proxy = self.control_proxy
+        if proxy is not None:
+            proxy.Stop()
 
     def next(self) -> None:
-        if hasattr(self, "control_proxy"):
-            self.control_proxy.Next()
+        proxy = self.control_proxy
+        if proxy is not None:
+            proxy.Next()
 
     def previous(self) -> None:
-        if hasattr(self, "control_proxy"):
-            self.control_proxy.Previous()
+        proxy = self.control_proxy
+        if proxy is not None:
+            proxy.Previous()
 
     def seek(self, offset: float) -> None:
         """Causes the player to seek forward or backward <offset> seconds."""
-        if hasattr(self, "control_proxy"):
-            o = round(offset * 1000 * 1000)
-            self.control_proxy.Seek(o)
+        proxy = self.control_proxy
+        if proxy is not None:
+            o = _to_usec(offset)
+            self._position_cache = None
+            proxy.Seek(o)
 
     def seek_absolute(self, position: float) -> None:
         """Causes the player to seek to <position> seconds in current track."""
-        if hasattr(self, "control_proxy"):
+        proxy = self.control_proxy
+        if proxy is not None:
             curr = self.get_position()
             if curr is None:
-                raise ValueError("no current position")
+                raise NoPosition("no current position")
             offset = position - curr
-            o = round(offset * 1000 * 1000)
-            self.control_proxy.Seek(o)
+            o = _to_usec(offset)
+            self._position_cache = None
+            proxy.Seek(o)
 
     def set_position(self, track_id: str, position: float) -> None:
         """Causes the player to seek forward or backward <position> seconds."""
-        if hasattr(self, "control_proxy"):
-            p = round(position * 1000 * 1000)
-            self.control_proxy.SetPosition(track_id, p)
+        proxy = self.control_proxy
+        if proxy is not None:
+            # Home Assistant often re-sends the position the player is
+            # already at; skip those without a D-Bus round trip.
+            current = self._cached_position()
+            if (
+                current is not None
+                and abs(current - position) < SET_POSITION_TOLERANCE
+                and self.state.Metadata.get("mpris:trackid") == track_id
+            ):
+                return
+            p = _to_usec(position)
+            self._position_cache = None
+            proxy.SetPosition(track_id, p)
+
+
+@dataclass
+class _PendingSeek:
+    """A seek or position change waiting to be sent to a player."""
+
+    future: "Future[None]"
+    offset: float = 0.0
+    track_id: Optional[str] = None
+    position: Optional[float] = None
+
+
+def _run_into_future(call: Callable[[], None], future: "Future[None]") -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        call()
+    except BaseException as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(None)
 
 
-def is_mpris(bus_name: str) -> bool:
-    return bus_name.startswith("org.mpris.MediaPlayer2")
+def _cancelled_future() -> "Future[None]":
+    future: "Future[None]" = Future()
+    future.cancel()
+    return future
 
 
-class PlayerCollection(Dict[str, Player]):
-    def lookup_by_identity(self, i: str) -> Player:
-        for p in self.values():
-            if p.identity == i:
-                return p
-        raise KeyError(i)
+def _cancel_if_cancelled(future: "Future[None]", queued: "Future[None]") -> None:
+    # The queued call was dropped before it ran; release whoever waits.
+    if queued.cancelled():
+        future.cancel()
 
-    def lookup(self, i: str) -> Player:
+
+def _log_control_failure(future: "Future[None]") -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        _LOGGER.warning("Player control request failed: %s", exc)
+
+
+def _disconnect_all(obj: GObject.GObject, handler_ids: List[int]) -> None:
+    for handler_id in handler_ids:
         try:
-            p = self[i]
-            return p
-        except KeyError:
-            return self.lookup_by_identity(i)
+            obj.disconnect(handler_id)
+        except ImportError:
+            pass
 
-    def add(self, bus: SessionMessageBus, player_id: str) -> Player:
-        p = Player(bus, player_id)
+
+def is_mpris(bus_name: str) -> bool:
+    return bus_name.startswith(_MPRIS_PREFIX)
+
+
+class PlayerCollection(Dict[str, Player]):
+    def add(self, p: Player) -> Player:
+        identities = {q.identity for q in self.values()}
 
         def already(s: str) -> bool:
-            try:
-                self.lookup_by_identity(s)
-                return True
-            except KeyError:
-                return False
+            return s in identities
 
         pattern = p.identity.replace("%", "%%") + " (%d)"
         if already(p.identity):
@@ -814,7 +1209,7 @@ class PlayerCollection(Dict[str, Player]):
                 p.identity = newidentity
                 break
 
-        self[player_id] = p
+        self[p.player_id] = p
         return p
 
     def remove(self, player: Player) -> None:
@@ -824,7 +1219,23 @@ class PlayerCollection(Dict[str, Player]):
         # FIXME: figure out how to solve that problem without
         # explicit cleanups like these.
         player.cleanup()
-        del self[player.player_id]
+        self.detach(player.player_id)
+
+    def detach(self, player_id: str) -> Optional[Player]:
+        """
+        Removes the player with the given ID from the collection without
+        cleaning it up, returning it (or None if it is not present).
+        """
+        return self.pop(player_id, None)
+
+
+# Player signals re-emitted by DBusMPRISInterface with a "player-" prefix.
+_FORWARDED_PLAYER_SIGNALS = (
+    "playback-status-changed",
+    "property-changed",
+    "metadata-changed",
+    "seeked",
+)
 
 
 class DBusMPRISInterface(threading.Thread, GObject.GObject):
@@ -872,8 +1283,22 @@ class DBusMPRISInterface(threading.Thread, GObject.GObject):
 
         self.loop = EventLoop()
         self.bus = SessionMessageBus()
-        self.players_lock = threading.RLock()
+        self.players_lock = threading.Lock()
         self.players = PlayerCollection()
+        self._players_table: Mapping[str, Player] = MappingProxyType({})
+        self._players_snapshot: Tuple[Player, ...] = ()
+        self._player_handler_ids: Dict[str, List[int]] = {}
+        # Set by stop_(); players discovered after that are discarded.
+        self._stopping = False
+        # One serial control queue per player ID, so that a hung player
+        # only holds up requests for itself.  Guarded by players_lock.
+        self._control_executors: Dict[str, ThreadPoolExecutor] = {}
+        self._seeks_lock = threading.Lock()
+        self._pending_seeks: Dict[Player, _PendingSeek] = {}
+        self._seeks_source: Optional[int] = None
+        self._seeks_closed = False
+        self._name_owner_subscription: Optional[int] = None
+        self.refresher = PropertiesRefresher()
         self.proxy = self.bus.get_proxy(
             "org.freedesktop.DBus",
             "/org/freedesktop/DBus",
@@ -889,122 +1314,173 @@ class DBusMPRISInterface(threading.Thread, GObject.GObject):
         if is_mpris(bus_name):
             if not new_owner:
                 # is gone
-                m: Optional[Player] = None
+                handler_ids: List[int] = []
+                executor: Optional[ThreadPoolExecutor] = None
                 with self.players_lock:
-                    if old_owner in self.players:
-                        m = self.players[old_owner]
-                        for ff in [
-                            self._player_playback_status_changed,
-                            self._player_metadata_changed,
-                            self._player_property_changed,
-                            self._player_seeked,
-                        ]:
-                            try:
-                                m.disconnect_by_func(ff)
-                            except ImportError:
-                                pass
-                        self.players.remove(m)
+                    m = self.players.detach(old_owner)
+                    if m:
+                        handler_ids = self._player_handler_ids.pop(old_owner, [])
+                        executor = self._control_executors.pop(old_owner, None)
+                        self._publish_players()
                 if m:
+                    # New lookups can no longer find the player, and calls
+                    # already under way are ignored once it is cleaned up,
+                    # so its (D-Bus bound) teardown needs no lock.
+                    _disconnect_all(m, handler_ids)
+                    m.cleanup()
+                    if executor is not None:
+                        executor.shutdown(wait=False, cancel_futures=True)
                     self.emit(
                         "player-gone",
                         m,
                     )
             if not old_owner:
                 # is new
-                m = None
                 with self.players_lock:
-                    if new_owner not in self.players:
-                        try:
-                            m = self.players.add(self.bus, new_owner)
-                            for s, ff in [
-                                (
-                                    "playback-status-changed",
-                                    self._player_playback_status_changed,
-                                ),
-                                (
-                                    "property-changed",
-                                    self._player_property_changed,
-                                ),
-                                (
-                                    "metadata-changed",
-                                    self._player_metadata_changed,
-                                ),
-                                (
-                                    "seeked",
-                                    self._player_seeked,
-                                ),
-                            ]:
-                                m.connect(s, ff)
-                        except BadPlayer:
-                            msg = (
-                                f"Ignoring player {new_owner} — probably badly"
-                                " implemented D-Bus spec; please report this"
-                                " traceback as a bug (see README.md)."
-                            )
-                            _LOGGER.exception(msg)
-                if m:
-                    self.emit(
-                        "player-appeared",
-                        m,
-                    )
+                    known = new_owner in self.players
+                if not known:
+                    m = self._discover_player(new_owner)
+                    if m:
+                        self._add_player(m)
+
+    def _discover_player(self, player_id: str) -> Optional[Player]:
+        # Discovery involves several D-Bus round trips, so it must not
+        # happen with the players lock held.
+        try:
+            return Player(self.bus, player_id, self.refresher)
+        except BadPlayer:
+            msg = (
+                f"Ignoring player {player_id} — probably badly"
+                " implemented D-Bus spec; please report this"
+                " traceback as a bug (see README.md)."
+            )
+            _LOGGER.exception(msg)
+            return None
 
-    def _player_playback_status_changed(
-        self,
-        player: Player,
-        status: str,
-    ) -> None:
+    def _add_player(self, m: Player) -> None:
+        with self.players_lock:
+            if self._stopping or m.player_id in self.players:
+                # Either shutting down, or discovered twice concurrently
+                # (in which case the first one is kept).
+                m.cleanup()
+                return
+            self.players.add(m)
+            self._control_executors[m.player_id] = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="mpris-control",
+            )
+            self._publish_players()
+            self._player_handler_ids[m.player_id] = [
+                m.connect(s, self._forward_player_signal, "player-" + s)
+                for s in _FORWARDED_PLAYER_SIGNALS
+            ]
         self.emit(
-            "player-playback-status-changed",
-            player,
-            status,
+            "player-appeared",
+            m,
         )
 
-    def _player_metadata_changed(
-        self, player: Player, metadata: Dict[str, Any]
-    ) -> None:
-        self.emit(
-            "player-metadata-changed",
-            player,
-            metadata,
-        )
+    def _add_discovered_player(self, bus_name: str, m: Player) -> bool:
+        # GLib idle callback for the players _initialize_existing_names
+        # finds.  Their name may have gone away after it was looked up, in
+        # which case its NameOwnerChanged was handled (and ignored) before
+        # the player was known, so its owner is checked once more here, on
+        # the main loop, where no further owner change can slip in between.
+        if self._stopping:
+            m.cleanup()
+            return False
+        try:
+            owner = self.proxy.GetNameOwner(bus_name)
+        except DBusError:
+            owner = None
+        if owner != m.player_id:
+            m.cleanup()
+            return False
+        self._add_player(m)
+        return False
 
-    def _player_seeked(self, player: Player, position: float) -> None:
-        self.emit(
-            "player-seeked",
-            player,
-            position,
-        )
+    def _forward_player_signal(self, player: Player, *args: Any) -> None:
+        # Connected with the name of the signal to re-emit as user data.
+        *values, signal = args
+        self.emit(signal, player, *values)
 
-    def _player_property_changed(
-        self,
-        player: Player,
-        name: str,
-        value: Any,
-    ) -> None:
-        self.emit(
-            "player-property-changed",
-            player,
-            name,
-            value,
-        )
+    def _discover_bus_name(self, bus_name: str) -> Optional[Player]:
+        try:
+            owner = self.proxy.GetNameOwner(bus_name)
+        except DBusError:
+            # The name went away since it was listed.
+            return None
+        return self._discover_player(owner) if owner else None
 
     def _initialize_existing_names(self) -> None:
-        names = self.proxy.ListNames()
-        for bus_name in names:
-            if is_mpris(bus_name):
-                owner = self.proxy.GetNameOwner(bus_name)
-                if owner:
-                    self._name_owner_changed(bus_name, "", owner)
+        # Runs on its own thread, never on the main loop, which keeps
+        # dispatching signals and timeouts while players are discovered.
+        names = [n for n in self.proxy.ListNames() if is_mpris(n)]
+        # Players already on the bus at startup (including looking up the
+        # owner of each name) are discovered in parallel, so startup takes
+        # about as long as the slowest player rather than the sum of all
+        # of them.  They are handed to the main loop in bus name order.
+        with ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix="mpris-discovery",
+        ) as executor:
+            for name, m in zip(names, executor.map(self._discover_bus_name, names)):
+                if m:
+                    GLib.idle_add(self._add_discovered_player, name, m)
+
+    def _name_owner_changed_signal(
+        self,
+        unused_connection: Any,
+        unused_sender: str,
+        unused_path: str,
+        unused_iface: str,
+        unused_signal: str,
+        parameters: GLib.Variant,
+    ) -> None:
+        self._name_owner_changed(*parameters.unpack())
 
     def run(self) -> None:
-        self.proxy.NameOwnerChanged.connect(self._name_owner_changed)
-        GLib.idle_add(lambda: self._initialize_existing_names())
+        # Subscribe with an arg0namespace match rule, so that the bus only
+        # sends us owner changes of MPRIS names rather than every one of
+        # them (browsers churn through lots of names).
+        self._name_owner_subscription = self.bus.connection.signal_subscribe(
+            "org.freedesktop.DBus",
+            "org.freedesktop.DBus",
+            "NameOwnerChanged",
+            "/org/freedesktop/DBus",
+            _MPRIS_PREFIX,
+            Gio.DBusSignalFlags.MATCH_ARG0_NAMESPACE,
+            self._name_owner_changed_signal,
+        )
+        threading.Thread(
+            target=self._initialize_existing_names,
+            name="mpris-initial-discovery",
+            daemon=True,
+        ).start()
         self.loop.run()
 
     def stop_(self) -> None:
+        if self._name_owner_subscription is not None:
+            self.bus.connection.signal_unsubscribe(self._name_owner_subscription)
+            self._name_owner_subscription = None
         with self.players_lock:
+            self._stopping = True
+            handler_ids, self._player_handler_ids = self._player_handler_ids, {}
             for player in list(self.players.values()):
+                _disconnect_all(player, handler_ids.get(player.player_id, []))
                 self.players.remove(player)
+            executors, self._control_executors = self._control_executors, {}
+            self._publish_players()
+        with self._seeks_lock:
+            self._seeks_closed = True
+            if self._seeks_source is not None:
+                GLib.source_remove(self._seeks_source)
+                self._seeks_source = None
+            pending_seeks, self._pending_seeks = self._pending_seeks, {}
+        # Nobody will flush these anymore; release whoever waits on them.
+        for pending in pending_seeks.values():
+            pending.future.cancel()
+        for executor in executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
         _LOGGER.debug("Quitting loop")
         self.emit("mpris-shutdown")
         self.loop.quit()
@@ -1013,60 +1489,156 @@ class DBusMPRISInterface(threading.Thread, GObject.GObject):
         _LOGGER.debug("Quit loop")
 
     def get_players(self) -> List[Player]:
-        with self.players_lock:
-            return list(self.players.values())
-
-    def play(self, identity_or_player_id: str) -> None:
-        # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).play()
-
-    def pause(self, identity_or_player_id: str) -> None:
+        return list(self._players_snapshot)
+
+    def _publish_players(self) -> None:
+        # Must be called with players_lock held, after every change to
+        # self.players.  Publishes a read-only table that maps both player
+        # IDs and identities to players (player IDs take precedence), and a
+        # snapshot of the players, so readers never need the lock.  The
+        # table is the only way players are looked up.
+        table: Dict[str, Player] = {p.identity: p for p in self.players.values()}
+        table.update(self.players)
+        self._players_table = MappingProxyType(table)
+        self._players_snapshot = tuple(self.players.values())
+
+    def _lookup(self, identity_or_player_id: str) -> Player:
+        # May raise KeyError.  A player cleaned up right after being looked
+        # up simply ignores whatever call is made on it.
+        return self._players_table[identity_or_player_id]
+
+    def _submit(
+        self,
+        identity_or_player_id: str,
+        method: str,
+        *args: Any,
+    ) -> "Future[None]":
+        # May raise KeyError.  The player is looked up right away, but the
+        # D-Bus call itself runs on the player's control queue, so that a
+        # hung player does not hold up the caller nor other players.
+        # Cancelling the returned future drops the call if it has not
+        # started yet.
+        player = self._lookup(identity_or_player_id)
+        executor = self._control_executors.get(player.player_id)
+        if executor is None:
+            # The player is gone, or stop_() has been called.
+            return _cancelled_future()
+        try:
+            future = executor.submit(getattr(player, method), *args)
+        except RuntimeError:
+            # Its control queue has been shut down already.
+            return _cancelled_future()
+        future.add_done_callback(_log_control_failure)
+        return future
+
+    def play(self, identity_or_player_id: str) -> "Future[None]":
         # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).pause()
+        return self._submit(identity_or_player_id, "play")
 
-    def stop(self, identity_or_player_id: str) -> None:
+    def pause(self, identity_or_player_id: str) -> "Future[None]":
         # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).stop()
+        return self._submit(identity_or_player_id, "pause")
 
-    def next(self, identity_or_player_id: str) -> None:
+    def stop(self, identity_or_player_id: str) -> "Future[None]":
         # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).next()
+        return self._submit(identity_or_player_id, "stop")
 
-    def previous(self, identity_or_player_id: str) -> None:
+    def next(self, identity_or_player_id: str) -> "Future[None]":
         # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).previous()
+        return self._submit(identity_or_player_id, "next")
 
-    def seek(self, identity_or_player_id: str, offset: float) -> None:
+    def previous(self, identity_or_player_id: str) -> "Future[None]":
         # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).seek(offset)
+        return self._submit(identity_or_player_id, "previous")
+
+    def _pending_seek(self, player: Player) -> _PendingSeek:
+        # Must be called with seeks_lock held.
+        pending = self._pending_seeks.get(player)
+        if pending is None:
+            future: "Future[None]" = Future()
+            future.add_done_callback(_log_control_failure)
+            pending = self._pending_seeks[player] = _PendingSeek(future)
+        if self._seeks_source is None:
+            self._seeks_source = GLib.timeout_add(
+                SEEK_COALESCE_MS,
+                self._flush_seeks,
+            )
+        return pending
+
+    def _flush_seeks(self) -> bool:
+        with self._seeks_lock:
+            pending_seeks, self._pending_seeks = self._pending_seeks, {}
+            self._seeks_source = None
+        for player, pending in pending_seeks.items():
+            if pending.position is not None:
+                assert pending.track_id is not None
+                call = partial(
+                    player.set_position,
+                    pending.track_id,
+                    pending.position,
+                )
+            else:
+                call = partial(player.seek, pending.offset)
+            executor = self._control_executors.get(player.player_id)
+            if executor is None:
+                # The player is gone, or stop_() has been called.
+                pending.future.cancel()
+                continue
+            try:
+                queued = executor.submit(_run_into_future, call, pending.future)
+            except RuntimeError:
+                # Its control queue has been shut down already.
+                pending.future.cancel()
+            else:
+                queued.add_done_callback(
+                    partial(_cancel_if_cancelled, pending.future),
+                )
+        return False
+
+    def seek(self, identity_or_player_id: str, offset: float) -> "Future[None]":
+        # May raise KeyError.  Seeks arriving in quick succession (e.g. while
+        # a slider is dragged) are coalesced into a single D-Bus call.  Bad
+        # offsets raise OverflowError or ValueError here, to their caller
+        # alone, rather than failing the coalesced call for everyone.
+        player = self._lookup(identity_or_player_id)
+        _to_usec(offset)
+        with self._seeks_lock:
+            if self._seeks_closed:
+                return _cancelled_future()
+            pending = self._pending_seek(player)
+            if pending.position is not None:
+                position = pending.position + offset
+                _to_usec(position)
+                pending.position = position
+            else:
+                total = pending.offset + offset
+                _to_usec(total)
+                pending.offset = total
+            return pending.future
 
     def set_position(
         self,
         identity_or_player_id: str,
         track_id: str,
         position: float,
-    ) -> None:
-        # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).set_position(
-                track_id,
-                position,
-            )
+    ) -> "Future[None]":
+        # May raise KeyError.  Coalesced like seek(); the last position wins.
+        player = self._lookup(identity_or_player_id)
+        _to_usec(position)
+        with self._seeks_lock:
+            if self._seeks_closed:
+                return _cancelled_future()
+            pending = self._pending_seek(player)
+            pending.track_id, pending.position = track_id, position
+            return pending.future
 
     def seek_absolute(
         self,
         identity_or_player_id: str,
         position: float,
-    ) -> None:
+    ) -> "Future[None]":
         # May raise KeyError.
-        with self.players_lock:
-            self.players.lookup(identity_or_player_id).seek_absolute(position)
+        return self._submit(identity_or_player_id, "seek_absolute", position)
 
 
 if __name__ == "__main__":
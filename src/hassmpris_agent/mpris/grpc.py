@@ -21,6 +21,7 @@ from hassmpris.certs import PEM
 
 import json
 import grpc
+from dasbus.error import DBusError
 
 from gi.repository import GObject  # noqa
 from cryptography.x509 import Certificate
@@ -29,6 +30,7 @@ from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from hassmpris.proto import mpris_pb2_grpc, mpris_pb2
 from hassmpris_agent.mpris.dbus import (
     DBusMPRISInterface,
+    NoPosition,
     Player,
     ALL_CAN_PROPS,
     ALL_NUMERIC_PROPS,
@@ -39,6 +41,10 @@ from hassmpris_agent.mpris.dbus import (
 
 HEARTBEAT_FREQUENCY: int = 10
 
+# How long (in seconds) a control request may wait for the player before
+# the client is told it timed out.
+CONTROL_TIMEOUT: float = 10.0
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -57,12 +63,12 @@ def metadata_to_json_metadata(metadata: Any) -> str:
 
 
 def playerappearedmessage(player: Player) -> mpris_pb2.MPRISUpdateReply:
-    s = playback_status_to_PlayerStatus(player.PlaybackStatus)
-    m = metadata_to_json_metadata(player.Metadata)
+    s = playback_status_to_PlayerStatus(player.state.PlaybackStatus)
+    m = metadata_to_json_metadata(player.state.Metadata)
     props = {}
     kwargs = {}
     for prop in list(ALL_CAN_PROPS) + list(ALL_NUMERIC_PROPS):
-        props[prop] = getattr(player, prop)
+        props[prop] = getattr(player.state, prop)
     position = player.get_position()
     if position is not None and position != 0.0:
         kwargs["seeked"] = mpris_pb2.MPRISPlayerSeeked(position=position)
@@ -116,6 +122,37 @@ def player_id_validated(f: ServicerContextFunc) -> ServicerContextFunc:
     return cast(ServicerContextFunc, inner)
 
 
+def await_control(
+    context: grpc.ServicerContext,
+    submit: Callable[[], "futures.Future[None]"],
+) -> None:
+    """
+    Submits a player control request and waits (for a bounded time) for
+    it to be carried out, turning failures into gRPC errors.  A request
+    that times out before the player got to it is dropped.  KeyError
+    (no such player) is left for player_id_validated to handle.
+    """
+    try:
+        future = submit()
+        future.result(timeout=CONTROL_TIMEOUT)
+    except futures.CancelledError:
+        context.abort(
+            grpc.StatusCode.UNAVAILABLE,
+            "The player is gone or the MPRIS interface is shutting down.",
+        )
+    except (futures.TimeoutError, TimeoutError):
+        future.cancel()
+        context.abort(
+            grpc.StatusCode.DEADLINE_EXCEEDED, "The player did not respond in time."
+        )
+    except NoPosition as e:
+        context.abort(grpc.StatusCode.FAILED_PRECONDITION, str(e))
+    except (OverflowError, ValueError) as e:
+        context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+    except DBusError as e:
+        context.abort(grpc.StatusCode.INTERNAL, "Player error: %s" % e)
+
+
 class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
     def __init__(self, mpris: DBusMPRISInterface):
         mpris_pb2_grpc.MPRISServicer.__init__(self)
@@ -325,7 +362,7 @@ class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
             a.STOPPED: self.mpris.stop,
         }
         f = actions[request.status]
-        f(request.player_id)
+        await_control(context, lambda: f(request.player_id))
         return mpris_pb2.ChangePlayerStatusReply()
 
     @player_id_validated
@@ -335,7 +372,7 @@ class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
         request: mpris_pb2.NextRequest,
         context: grpc.ServicerContext,
     ) -> mpris_pb2.NextReply:
-        self.mpris.next(request.player_id)
+        await_control(context, lambda: self.mpris.next(request.player_id))
         return mpris_pb2.NextReply()
 
     @player_id_validated
@@ -349,7 +386,7 @@ class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
             "Requested %s previous",
             request.player_id,
         )
-        self.mpris.previous(request.player_id)
+        await_control(context, lambda: self.mpris.previous(request.player_id))
         return mpris_pb2.PreviousReply()
 
     @player_id_validated
@@ -364,11 +401,10 @@ class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
             request.player_id,
             request.offset,
         )
-        try:
-            self.mpris.seek(request.player_id, request.offset)
-        except OverflowError as e:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
-
+        await_control(
+            context,
+            lambda: self.mpris.seek(request.player_id, request.offset),
+        )
         return mpris_pb2.SeekReply()
 
     @player_id_validated
@@ -383,15 +419,14 @@ class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
             request.player_id,
             request.position,
         )
-        try:
-            self.mpris.set_position(
+        await_control(
+            context,
+            lambda: self.mpris.set_position(
                 request.player_id,
                 request.track_id,
                 request.position,
-            )
-        except OverflowError as e:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
-
+            ),
+        )
         return mpris_pb2.SetPositionReply()
 
     @player_id_validated
@@ -406,14 +441,13 @@ class MPRISServicer(mpris_pb2_grpc.MPRISServicer):
             request.player_id,
             request.position,
         )
-        try:
-            self.mpris.seek_absolute(
+        await_control(
+            context,
+            lambda: self.mpris.seek_absolute(
                 request.player_id,
                 request.position,
-            )
-        except OverflowError as e:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
-
+            ),
+        )
         return mpris_pb2.SeekAbsoluteReply()
 
     def Ping(
@@ -0,0 +1,123 @@
+"""
+Stand-ins for the D-Bus connection and players, enough to drive
+DBusMPRISInterface without a session bus.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dasbus.error import DBusError
+
+
+class FakeConnection(object):
+    def signal_subscribe(self, *unused_args: Any) -> int:
+        return 1
+
+    def signal_unsubscribe(self, unused_subscription: int) -> None:
+        pass
+
+
+class FakeBusProxy(object):
+    def __init__(self) -> None:
+        # Bus name to unique name of its owner.
+        self.owners: Dict[str, str] = {}
+
+    def ListNames(self) -> List[str]:
+        return list(self.owners)
+
+    def GetNameOwner(self, bus_name: str) -> str:
+        try:
+            return self.owners[bus_name]
+        except KeyError:
+            raise DBusError("Name %s has no owner" % bus_name)
+
+
+class FakeBus(object):
+    connection = FakeConnection()
+
+    def get_proxy(self, *unused_args: Any, **unused_kwargs: Any) -> Any:
+        return FakeBusProxy()
+
+
+class FakeLoop(object):
+    def run(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+
+class FakePlayer(object):
+    def __init__(self, player_id: str) -> None:
+        self.player_id = player_id
+        self.identity = player_id
+        self.calls: List[Tuple[Any, ...]] = []
+        self.error: Exception | None = None
+        self.handlers: Dict[int, Tuple[str, Callable[..., Any]]] = {}
+        self.cleaned_up = False
+        # If set, calls wait for it before returning, like a hung player.
+        self.blocker: Optional[threading.Event] = None
+
+    def connect(self, signal: str, handler: Callable[..., Any], *args: Any) -> int:
+        handler_id = max(self.handlers, default=0) + 1
+        self.handlers[handler_id] = (signal, handler)
+        return handler_id
+
+    def disconnect(self, handler_id: int) -> None:
+        del self.handlers[handler_id]
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+    def _call(self, *call: Any) -> None:
+        if self.blocker is not None:
+            self.blocker.wait()
+        self.calls.append(call)
+        if self.error:
+            raise self.error
+
+    def play(self) -> None:
+        self._call("play")
+
+    def seek(self, offset: float) -> None:
+        self._call("seek", offset)
+
+    def set_position(self, track_id: str, position: float) -> None:
+        self._call("set_position", track_id, position)
+
+
+class FakeSignal(object):
+    def __init__(self) -> None:
+        self.callbacks: List[Callable[..., Any]] = []
+
+    def connect(self, callback: Callable[..., Any]) -> None:
+        self.callbacks.append(callback)
+
+    def disconnect(self, callback: Callable[..., Any]) -> None:
+        self.callbacks.remove(callback)
+
+
+class FakePropertiesProxy(object):
+    """A player's org.freedesktop.DBus.Properties proxy."""
+
+    def __init__(self, props: Dict[str, Any]) -> None:
+        self.props = props
+        self.getall_calls = 0
+        self.PropertiesChanged = FakeSignal()
+
+    def GetAll(self, unused_iface: str) -> Dict[str, Any]:
+        self.getall_calls += 1
+        return dict(self.props)
+
+
+class FakeControlProxy(object):
+    """A player's org.mpris.MediaPlayer2.Player proxy."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[Any, ...]] = []
+
+    def Seek(self, offset: int) -> None:
+        self.calls.append(("Seek", offset))
+
+    def SetPosition(self, track_id: str, position: int) -> None:
+        self.calls.append(("SetPosition", track_id, position))
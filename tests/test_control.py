@@ -0,0 +1,67 @@
+import threading
+from typing import Any, Iterator
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from hassmpris_agent.mpris import dbus as mpris_dbus  # noqa: E402
+
+from fakes import FakeBus, FakeLoop, FakePlayer  # noqa: E402
+
+
+@pytest.fixture
+def iface(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    monkeypatch.setattr(mpris_dbus, "SessionMessageBus", FakeBus)
+    monkeypatch.setattr(mpris_dbus, "EventLoop", FakeLoop)
+    i = mpris_dbus.DBusMPRISInterface()
+    yield i
+    for executor in i._control_executors.values():
+        executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def hung(iface: Any) -> Iterator[FakePlayer]:
+    p = FakePlayer("hung")
+    p.blocker = threading.Event()
+    iface._add_player(p)
+    yield p
+    p.blocker.set()
+
+
+def test_hung_player_does_not_hold_up_others(
+    iface: Any,
+    hung: FakePlayer,
+) -> None:
+    other = FakePlayer("other")
+    iface._add_player(other)
+    running = [iface.play("hung") for _ in range(8)]
+    iface.play("other").result(timeout=5)
+    assert other.calls == [("play",)]
+    assert not any(f.done() for f in running)
+
+
+def test_cancelled_queued_call_is_dropped(iface: Any, hung: FakePlayer) -> None:
+    first = iface.play("hung")
+    queued = iface.play("hung")
+    assert queued.cancel()
+    assert hung.blocker is not None
+    hung.blocker.set()
+    first.result(timeout=5)
+    assert hung.calls == [("play",)]
+
+
+def test_queued_calls_are_cancelled_when_player_goes(
+    iface: Any,
+    hung: FakePlayer,
+) -> None:
+    iface.play("hung")
+    queued = iface.play("hung")
+    seek = iface.seek("hung", 1.0)
+    iface._flush_seeks()
+    iface._name_owner_changed("org.mpris.MediaPlayer2.hung", "hung", "")
+    assert queued.cancelled()
+    assert seek.cancelled()
+    with pytest.raises(KeyError):
+        iface.play("hung")
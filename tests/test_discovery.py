@@ -0,0 +1,106 @@
+from typing import Any, Iterator, List
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from hassmpris_agent.mpris import dbus as mpris_dbus  # noqa: E402
+
+from fakes import FakeBus, FakeLoop, FakePlayer  # noqa: E402
+
+BUS_NAME = "org.mpris.MediaPlayer2.fake"
+
+
+@pytest.fixture
+def iface(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    monkeypatch.setattr(mpris_dbus, "SessionMessageBus", FakeBus)
+    monkeypatch.setattr(mpris_dbus, "EventLoop", FakeLoop)
+    i = mpris_dbus.DBusMPRISInterface()
+    yield i
+    for executor in i._control_executors.values():
+        executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def appeared(iface: Any) -> List[Any]:
+    players: List[Any] = []
+    iface.connect("player-appeared", lambda unused_i, p: players.append(p))
+    return players
+
+
+def test_discovered_player_is_added(iface: Any, appeared: List[Any]) -> None:
+    player = FakePlayer(":1.42")
+    iface.proxy.owners[BUS_NAME] = player.player_id
+    iface._add_discovered_player(BUS_NAME, player)
+    assert iface.get_players() == [player]
+    assert appeared == [player]
+    assert not player.cleaned_up
+
+
+def test_player_gone_before_being_added_is_dropped(
+    iface: Any,
+    appeared: List[Any],
+) -> None:
+    player = FakePlayer(":1.42")
+    # The name went away (and its NameOwnerChanged was handled, finding
+    # nothing to remove) between discovery and the idle callback.
+    iface._name_owner_changed(BUS_NAME, player.player_id, "")
+    iface._add_discovered_player(BUS_NAME, player)
+    assert iface.get_players() == []
+    assert appeared == []
+    assert player.cleaned_up
+
+
+def test_name_taken_over_before_being_added_is_dropped(
+    iface: Any,
+    appeared: List[Any],
+) -> None:
+    player = FakePlayer(":1.42")
+    iface.proxy.owners[BUS_NAME] = ":1.43"
+    iface._add_discovered_player(BUS_NAME, player)
+    assert iface.get_players() == []
+    assert appeared == []
+    assert player.cleaned_up
+
+
+def test_player_discovered_after_shutdown_is_dropped(
+    iface: Any,
+    appeared: List[Any],
+) -> None:
+    iface._initialize_existing_names = lambda: None
+    iface.start()
+    iface.stop_()
+    player = FakePlayer(":1.42")
+    iface.proxy.owners[BUS_NAME] = player.player_id
+    iface._add_discovered_player(BUS_NAME, player)
+    iface._add_player(player)
+    assert iface.get_players() == []
+    assert appeared == []
+    assert player.cleaned_up
+
+
+def test_players_are_looked_up_by_id_or_unique_identity(iface: Any) -> None:
+    one, two = FakePlayer(":1.42"), FakePlayer(":1.43")
+    one.identity = two.identity = "VLC"
+    iface._add_player(one)
+    iface._add_player(two)
+    assert two.identity == "VLC (2)"
+    assert iface._lookup("VLC") is one
+    assert iface._lookup("VLC (2)") is two
+    assert iface._lookup(":1.43") is two
+    iface._name_owner_changed(BUS_NAME, ":1.42", "")
+    with pytest.raises(KeyError):
+        iface._lookup("VLC")
+
+
+def test_shutdown_disconnects_forwarded_signals(iface: Any) -> None:
+    player = FakePlayer(":1.42")
+    iface._add_player(player)
+    assert player.handlers
+    iface._initialize_existing_names = lambda: None
+    iface.start()
+    iface.stop_()
+    assert player.handlers == {}
+    assert iface._player_handler_ids == {}
+    assert player.cleaned_up
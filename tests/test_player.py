@@ -0,0 +1,129 @@
+import time
+from typing import Any
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from gi.repository import GObject  # noqa: E402
+
+from hassmpris_agent.mpris import dbus as mpris_dbus  # noqa: E402
+from hassmpris_agent.mpris.dbus import (  # noqa: E402
+    POSITION_CACHE_PLAYING_TTL,
+    POSITION_CACHE_TTL,
+    BasePropertiesController,
+    NoPosition,
+    Player,
+    PlayerState,
+    STATUS_PAUSED,
+    STATUS_PLAYING,
+)
+
+from fakes import FakeControlProxy  # noqa: E402
+
+USEC = 1_000_000
+TRACK = "/org/mpris/MediaPlayer2/Track/1"
+
+
+@pytest.fixture
+def player() -> Player:
+    # A player as Player.__init__ leaves it, minus the D-Bus discovery.
+    p = Player.__new__(Player)
+    GObject.GObject.__init__(p)
+    p.player_id = p.identity = ":1.42"
+    p.state = PlayerState()
+    p.state.PlaybackStatus = STATUS_PAUSED
+    p.state.Metadata = {"mpris:trackid": TRACK}
+    p._last_props = None
+    p.control_proxy = FakeControlProxy()  # type: ignore[assignment]
+    p.properties_proxy_controller = None
+    p._position_cache = None
+    p._cleanuppers = []
+    return p
+
+
+def test_cached_position_while_paused(player: Player) -> None:
+    now = time.monotonic()
+    player._position_cache = (now, 10.0)
+    assert player.get_position() == 10.0
+    player._position_cache = (now - POSITION_CACHE_TTL - 0.1, 10.0)
+    assert player.get_position() is None
+
+
+def test_cached_position_is_extrapolated_while_playing(player: Player) -> None:
+    player.state.PlaybackStatus = STATUS_PLAYING
+    player.state.Rate = 2.0
+    age = POSITION_CACHE_PLAYING_TTL / 2
+    player._position_cache = (time.monotonic() - age, 10.0)
+    position = player.get_position()
+    assert position is not None
+    assert 10.0 + 2 * age <= position < 10.0 + 2 * POSITION_CACHE_PLAYING_TTL
+    player._position_cache = (
+        time.monotonic() - POSITION_CACHE_PLAYING_TTL - 0.01,
+        10.0,
+    )
+    assert player.get_position() is None
+
+
+def test_status_change_invalidates_cached_position(player: Player) -> None:
+    player._position_cache = (time.monotonic(), 10.0)
+    player._set_property("PlaybackStatus", STATUS_PLAYING)
+    assert player._position_cache is None
+
+
+def test_position_is_seeded_from_full_refreshes(player: Player) -> None:
+    controller = BasePropertiesController(None)  # type: ignore[arg-type]
+    controller.connect("properties-changed", player._handle_properties_changed)
+    controller.connect("position-refreshed", player._handle_position_refreshed)
+    sent = time.monotonic()
+    controller._emit_refreshed(
+        {"PlaybackStatus": STATUS_PAUSED, "Position": 5 * USEC},
+        sent,
+    )
+    assert player._position_cache == (sent, 5.0)
+
+
+def test_refresh_is_timed_at_request(player: Player) -> None:
+    controller = BasePropertiesController(None)  # type: ignore[arg-type]
+    controller.connect("position-refreshed", player._handle_position_refreshed)
+    # The reply to a refresh sent long ago is too old to be reused.
+    sent = time.monotonic() - POSITION_CACHE_TTL - 0.1
+    controller._emit_refreshed({"Position": 5 * USEC}, sent)
+    assert player._cached_position() is None
+
+
+def test_properties_changed_does_not_seed_position(player: Player) -> None:
+    player._handle_properties_changed(None, {"Position": 5 * USEC})
+    assert player._position_cache is None
+
+
+def test_set_position_skips_near_duplicates(player: Player) -> None:
+    proxy: Any = player.control_proxy
+    player._position_cache = (time.monotonic(), 10.0)
+    player.set_position(TRACK, 10.01)
+    assert proxy.calls == []
+    player._position_cache = (time.monotonic(), 10.0)
+    player.set_position("/other/track", 10.01)
+    assert proxy.calls == [("SetPosition", "/other/track", 10_010_000)]
+    # Setting the position invalidates the cache.
+    assert player._position_cache is None
+    player._position_cache = (time.monotonic(), 10.0)
+    player.set_position(TRACK, 11.0)
+    assert proxy.calls[-1] == ("SetPosition", TRACK, 11 * USEC)
+
+
+def test_seek_absolute_needs_a_position(player: Player) -> None:
+    with pytest.raises(NoPosition):
+        player.seek_absolute(10.0)
+    player._position_cache = (time.monotonic(), 10.0)
+    player.seek_absolute(15.0)
+    proxy: Any = player.control_proxy
+    assert proxy.calls == [("Seek", 5 * USEC)]
+
+
+def test_seek_rejects_out_of_range_offsets(player: Player) -> None:
+    with pytest.raises(OverflowError):
+        player.seek(float(2**64))
+    with pytest.raises(ValueError):
+        mpris_dbus._to_usec(float("nan"))
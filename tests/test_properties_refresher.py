@@ -0,0 +1,90 @@
+import threading
+from typing import Any, Iterator, List
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from hassmpris_agent.mpris import dbus as mpris_dbus  # noqa: E402
+
+from fakes import FakePropertiesProxy  # noqa: E402
+
+
+class FakeController(object):
+    def __init__(self, refreshed: List["FakeController"]) -> None:
+        self.refreshed = refreshed
+
+    def refresh(self) -> None:
+        self.refreshed.append(self)
+
+
+def test_refreshes_are_coalesced() -> None:
+    refreshed: List[FakeController] = []
+    one, two = FakeController(refreshed), FakeController(refreshed)
+    refresher = mpris_dbus.PropertiesRefresher()
+    refresher.schedule(one)
+    refresher.schedule(one)
+    refresher.schedule(two)
+    source = refresher._source
+    assert source is not None
+    refresher._flush()
+    assert sorted(map(id, refreshed)) == sorted(map(id, (one, two)))
+    assert refresher._source is None
+    mpris_dbus.GLib.source_remove(source)
+
+
+def test_cancel_from_another_thread() -> None:
+    refreshed: List[FakeController] = []
+    one, two = FakeController(refreshed), FakeController(refreshed)
+    refresher = mpris_dbus.PropertiesRefresher()
+    refresher.schedule(one)
+    refresher.schedule(two)
+    t = threading.Thread(target=refresher.cancel, args=(one,))
+    t.start()
+    t.join()
+    assert refresher._source is not None
+    refresher.cancel(two)
+    # The last cancellation removes the timeout altogether.
+    assert refresher._source is None
+    refresher._flush()
+    assert refreshed == []
+
+
+PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+
+
+@pytest.fixture
+def controller() -> Iterator[mpris_dbus.SignalPropertiesController]:
+    refresher = mpris_dbus.PropertiesRefresher()
+    c = mpris_dbus.SignalPropertiesController(
+        FakePropertiesProxy({}),
+        refresher,
+    )
+    c.always_refresh = True
+    yield c
+    c.stop()
+
+
+def test_untracked_property_changes_are_ignored(
+    controller: mpris_dbus.SignalPropertiesController,
+) -> None:
+    changes: List[Any] = []
+    controller.connect("properties-changed", lambda unused_c, p: changes.append(p))
+    controller._properties_changed(PLAYER_IFACE, {"Volume": 0.5}, [])
+    controller._properties_changed(PLAYER_IFACE, {}, ["Shuffle"])
+    controller._properties_changed("org.mpris.MediaPlayer2", {"Rate": 2.0}, [])
+    assert changes == []
+    assert controller._refresher._source is None
+
+    controller._properties_changed(PLAYER_IFACE, {"Volume": 0.5, "Rate": 2.0}, [])
+    assert changes == [{"Volume": 0.5, "Rate": 2.0}]
+    assert controller._refresher._pending == {controller}
+
+
+def test_invalidated_tracked_properties_are_refreshed(
+    controller: mpris_dbus.SignalPropertiesController,
+) -> None:
+    controller.always_refresh = False
+    controller._properties_changed(PLAYER_IFACE, {}, ["Metadata"])
+    assert controller._refresher._pending == {controller}
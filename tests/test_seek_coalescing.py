@@ -0,0 +1,102 @@
+import time
+from typing import Any, Iterator
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from gi.repository import GLib  # noqa: E402
+
+from hassmpris_agent.mpris import dbus as mpris_dbus  # noqa: E402
+
+from fakes import FakeBus, FakeLoop, FakePlayer  # noqa: E402
+
+
+@pytest.fixture
+def iface(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    monkeypatch.setattr(mpris_dbus, "SessionMessageBus", FakeBus)
+    monkeypatch.setattr(mpris_dbus, "EventLoop", FakeLoop)
+    i = mpris_dbus.DBusMPRISInterface()
+    yield i
+    for executor in i._control_executors.values():
+        executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def player(iface: Any) -> FakePlayer:
+    p = FakePlayer("player")
+    iface._add_player(p)
+    return p
+
+
+def test_seeks_are_merged(iface: Any, player: FakePlayer) -> None:
+    f1 = iface.seek("player", 1.0)
+    f2 = iface.seek("player", 2.0)
+    assert f1 is f2
+    iface._flush_seeks()
+    f1.result(timeout=5)
+    assert player.calls == [("seek", 3.0)]
+
+
+def test_set_position_wins_and_absorbs_later_seeks(
+    iface: Any,
+    player: FakePlayer,
+) -> None:
+    iface.seek("player", 5.0)
+    iface.set_position("player", "/track/1", 10.0)
+    f = iface.seek("player", 2.0)
+    iface._flush_seeks()
+    f.result(timeout=5)
+    assert player.calls == [("set_position", "/track/1", 12.0)]
+
+
+def test_bad_arguments_fail_only_their_caller(
+    iface: Any,
+    player: FakePlayer,
+) -> None:
+    f = iface.seek("player", 1.0)
+    with pytest.raises(OverflowError):
+        iface.seek("player", float("inf"))
+    with pytest.raises(ValueError):
+        iface.set_position("player", "/track/1", float("nan"))
+    iface._flush_seeks()
+    f.result(timeout=5)
+    assert player.calls == [("seek", 1.0)]
+
+
+def test_player_errors_reach_the_future(iface: Any, player: FakePlayer) -> None:
+    player.error = RuntimeError("player failed")
+    f = iface.seek("player", 1.0)
+    iface._flush_seeks()
+    with pytest.raises(RuntimeError):
+        f.result(timeout=5)
+
+
+def test_seeks_are_flushed_by_the_main_loop(
+    iface: Any,
+    player: FakePlayer,
+) -> None:
+    f = iface.seek("player", 1.0)
+    context = GLib.MainContext.default()
+    deadline = time.monotonic() + 5
+    while not f.done() and time.monotonic() < deadline:
+        context.iteration(False)
+        time.sleep(0.005)
+    f.result(timeout=5)
+    assert player.calls == [("seek", 1.0)]
+
+
+def test_pending_seeks_are_cancelled_on_shutdown(
+    iface: Any,
+    player: FakePlayer,
+) -> None:
+    iface.start()
+    f = iface.seek("player", 1.0)
+    iface.stop_()
+    assert f.cancelled()
+    # stop_() forgets all players; put ours back to check late requests.
+    iface._players_table = {player.player_id: player}
+    assert iface.seek("player", 1.0).cancelled()
+    assert iface.set_position("player", "/track/1", 1.0).cancelled()
+    assert player.calls == []
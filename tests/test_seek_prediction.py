@@ -0,0 +1,136 @@
+from typing import Any, Iterator, List
+
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from hassmpris_agent.mpris import dbus as mpris_dbus  # noqa: E402
+from hassmpris_agent.mpris.dbus import (  # noqa: E402
+    _PREDICTORS,
+    _S_PAUSED,
+    _S_PLAYING,
+    _S_STOPPED,
+    PollSeekController,
+    STATUS_PAUSED,
+    STATUS_PLAYING,
+    STATUS_STOPPED,
+)
+
+from fakes import FakePropertiesProxy  # noqa: E402
+
+USEC = 1_000_000
+
+
+def predict(frm: int, to: int, *args: float) -> Any:
+    return _PREDICTORS[frm][to](*args)
+
+
+def test_predictors() -> None:
+    # Arguments: last position, time since the last change, minimum rate,
+    # maximum rate, gap since the previous check, slack.
+    args = (10.0, 100.0, 1.0, 2.0, 3.0, 0.5)
+    assert predict(_S_STOPPED, _S_STOPPED, *args) == (0.0, 0.0)
+    assert predict(_S_STOPPED, _S_PAUSED, *args) == (0.0, 0.0)
+    # Leaving stopped or paused, the player can only have played since
+    # the previous check, however long it was idle before.
+    assert predict(_S_STOPPED, _S_PLAYING, *args) == (0.0, 6.5)
+    assert predict(_S_PAUSED, _S_PLAYING, *args) == (10.0, 16.5)
+    assert predict(_S_PAUSED, _S_PAUSED, *args) == (10.0, 10.0)
+    assert predict(_S_PAUSED, _S_STOPPED, *args) == (0.0, 210.5)
+    assert predict(_S_PLAYING, _S_STOPPED, *args) == (0.0, 6.5)
+    assert predict(_S_PLAYING, _S_PAUSED, *args) == (10.0, 210.5)
+    assert predict(_S_PLAYING, _S_PLAYING, *args) == (109.5, 210.5)
+
+
+@pytest.fixture
+def proxy() -> FakePropertiesProxy:
+    return FakePropertiesProxy(
+        {"PlaybackStatus": STATUS_PAUSED, "Position": 10 * USEC, "Rate": 1.0},
+    )
+
+
+@pytest.fixture
+def controller(proxy: FakePropertiesProxy) -> Iterator[PollSeekController]:
+    c = PollSeekController(None, proxy)
+    c.start()
+    yield c
+    c.stop()
+
+
+@pytest.fixture
+def seeks(controller: PollSeekController) -> List[float]:
+    positions: List[float] = []
+    controller.connect("seeked", lambda unused_c, pos: positions.append(pos))
+    return positions
+
+
+def test_idle_players_are_polled_less_often(
+    proxy: FakePropertiesProxy,
+    controller: PollSeekController,
+) -> None:
+    calls = proxy.getall_calls
+    for _ in range(PollSeekController.PAUSED_TICKS - 1):
+        controller._tick()
+    assert proxy.getall_calls == calls
+    controller._tick()
+    assert proxy.getall_calls == calls + 1
+
+    proxy.props["PlaybackStatus"] = STATUS_STOPPED
+    proxy.props["Position"] = 0
+    controller._check_seeked()
+    calls = proxy.getall_calls
+    for _ in range(PollSeekController.STOPPED_TICKS - 1):
+        controller._tick()
+    assert proxy.getall_calls == calls
+    controller._tick()
+    assert proxy.getall_calls == calls + 1
+
+
+def test_resuming_after_backoff_is_not_a_seek(
+    proxy: FakePropertiesProxy,
+    controller: PollSeekController,
+    seeks: List[float],
+) -> None:
+    # The player resumed right after the previous check and has played
+    # for most of the (backed off) gap since then.
+    controller._last_sampled -= PollSeekController.PAUSED_TICKS
+    proxy.props["PlaybackStatus"] = STATUS_PLAYING
+    proxy.props["Position"] = 12 * USEC
+    controller._check_seeked()
+    assert seeks == []
+
+
+def test_position_change_while_paused_is_a_seek(
+    proxy: FakePropertiesProxy,
+    controller: PollSeekController,
+    seeks: List[float],
+) -> None:
+    proxy.props["Position"] = 30 * USEC
+    controller._check_seeked()
+    assert seeks == [30.0]
+    # The new position is the base for later predictions.
+    controller._check_seeked()
+    assert seeks == [30.0]
+
+
+def test_jump_on_resume_is_a_seek(
+    proxy: FakePropertiesProxy,
+    controller: PollSeekController,
+    seeks: List[float],
+) -> None:
+    proxy.props["PlaybackStatus"] = STATUS_PLAYING
+    proxy.props["Position"] = 60 * USEC
+    controller._check_seeked()
+    assert seeks == [60.0]
+
+
+def test_stopped_controllers_do_not_poll(
+    proxy: FakePropertiesProxy,
+    controller: PollSeekController,
+) -> None:
+    controller.stop()
+    calls = proxy.getall_calls
+    assert controller._check_seeked() is False
+    assert proxy.getall_calls == calls
+    assert mpris_dbus.PollSeekController._shared_source is None
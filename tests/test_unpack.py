@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip("gi")
+pytest.importorskip("dasbus")
+
+from gi.repository import GLib  # noqa: E402
+
+from hassmpris_agent.mpris.dbus import (  # noqa: E402
+    _unpack_bool,
+    _unpack_str,
+    unpack,
+)
+
+
+def test_scalars_are_returned_as_is() -> None:
+    for v in ("Playing", 1, 1.5, True, None):
+        assert unpack(v) is v
+
+
+def test_plain_containers_are_not_copied() -> None:
+    d = {"a": 1, "b": "x"}
+    lst = [1, "x", None]
+    assert unpack(d) is d
+    assert unpack(lst) is lst
+
+
+def test_variants_are_unpacked_entirely() -> None:
+    v = GLib.Variant(
+        "a{sv}",
+        {
+            "xesam:artist": GLib.Variant("as", ["One", "Two"]),
+            "mpris:length": GLib.Variant("x", 1234),
+        },
+    )
+    assert unpack(v) == {"xesam:artist": ["One", "Two"], "mpris:length": 1234}
+
+
+def test_nested_containers_are_unpacked() -> None:
+    obj = {
+        "a": [GLib.Variant("i", 1), {"b": GLib.Variant("s", "x")}],
+        "c": 2,
+    }
+    assert unpack(obj) == {"a": [1, {"b": "x"}], "c": 2}
+    # The original is left alone.
+    assert isinstance(obj["a"][0], GLib.Variant)
+
+
+def test_unpack_str_fast_path_and_fallback() -> None:
+    assert _unpack_str(GLib.Variant("s", "Playing")) == "Playing"
+    assert _unpack_str(GLib.Variant("o", "/track/1")) == "/track/1"
+    assert _unpack_str(GLib.Variant("i", 3)) == 3
+    assert _unpack_str("Paused") == "Paused"
+
+
+def test_unpack_bool_fast_path_and_fallback() -> None:
+    assert _unpack_bool(GLib.Variant("b", True)) is True
+    assert _unpack_bool(GLib.Variant("i", 1)) == 1
+    assert _unpack_bool(False) is False